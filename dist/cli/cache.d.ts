@@ -0,0 +1,7 @@
+export declare const DEPENDENCY_CACHE_TTL_MS: number;
+export declare function getDependencyCacheFile(): string;
+export declare function getPythonFingerprint(): Promise<string | null>;
+export declare function isDependencyCheckCached(fingerprint: string | null): Promise<boolean>;
+export declare function cacheDependencyCheck(fingerprint: string): Promise<void>;
+export declare function checkDependenciesWithCache(fingerprint: string | null, check: () => Promise<boolean>): Promise<boolean>;
+//# sourceMappingURL=cache.d.ts.map
\ No newline at end of file
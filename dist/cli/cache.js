@@ -0,0 +1,104 @@
+import fs from 'fs-extra';
+import path from 'path';
+import os from 'os';
+import { createHash } from 'crypto';
+export const DEPENDENCY_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+export function getDependencyCacheFile() {
+    const cacheDir = process.env.AI_IMPACT_TRACKER_CACHE_DIR
+        || path.join(process.env.XDG_CACHE_HOME || path.join(os.homedir(), '.cache'), 'ai-impact-tracker');
+    return path.join(cacheDir, 'dependencies.json');
+}
+async function findPythonOnPath() {
+    const extensions = process.platform === 'win32' ? (process.env.PATHEXT || '.EXE').split(';') : [''];
+    for (const dir of (process.env.PATH || '').split(path.delimiter)) {
+        if (!dir)
+            continue;
+        for (const extension of extensions) {
+            const candidate = path.join(dir, `python${extension}`);
+            try {
+                if ((await fs.stat(candidate)).isFile()) {
+                    return candidate;
+                }
+            }
+            catch (e) {
+            }
+        }
+    }
+    return null;
+}
+export async function getPythonFingerprint() {
+    try {
+        const executable = await findPythonOnPath();
+        if (!executable || path.basename(path.dirname(executable)) === 'shims')
+            return null;
+        const target = await fs.realpath(executable);
+        const stat = await fs.stat(target);
+        const parts = [
+            executable,
+            target,
+            stat.size,
+            stat.mtimeMs,
+            process.cwd(),
+            process.env.VIRTUAL_ENV,
+            process.env.CONDA_PREFIX,
+            process.env.PYTHONHOME
+        ];
+        const venvConfig = path.join(path.dirname(path.dirname(executable)), 'pyvenv.cfg');
+        try {
+            parts.push(venvConfig, (await fs.stat(venvConfig)).mtimeMs);
+        }
+        catch (e) {
+        }
+        return createHash('sha256').update(JSON.stringify(parts)).digest('hex');
+    }
+    catch (e) {
+        return null;
+    }
+}
+async function readDependencyCache() {
+    try {
+        const cache = await fs.readJson(getDependencyCacheFile());
+        if (cache && typeof cache === 'object' && !Array.isArray(cache)) {
+            return cache;
+        }
+    }
+    catch (e) {
+    }
+    return {};
+}
+export async function isDependencyCheckCached(fingerprint) {
+    if (!fingerprint || process.env.AI_IMPACT_TRACKER_NO_CACHE)
+        return false;
+    const checkedAt = (await readDependencyCache())[fingerprint];
+    return typeof checkedAt === 'number' && Date.now() - checkedAt < DEPENDENCY_CACHE_TTL_MS;
+}
+export async function cacheDependencyCheck(fingerprint) {
+    const now = Date.now();
+    const cache = {};
+    for (const [key, checkedAt] of Object.entries(await readDependencyCache())) {
+        if (typeof checkedAt === 'number' && now - checkedAt < DEPENDENCY_CACHE_TTL_MS) {
+            cache[key] = checkedAt;
+        }
+    }
+    cache[fingerprint] = now;
+    const cacheFile = getDependencyCacheFile();
+    const tempFile = `${cacheFile}.${process.pid}.tmp`;
+    try {
+        await fs.outputJson(tempFile, cache);
+        await fs.rename(tempFile, cacheFile);
+    }
+    catch (e) {
+        await fs.remove(tempFile).catch(() => undefined);
+    }
+}
+export async function checkDependenciesWithCache(fingerprint, check) {
+    if (await isDependencyCheckCached(fingerprint)) {
+        return true;
+    }
+    const available = await check();
+    if (available && fingerprint) {
+        await cacheDependencyCheck(fingerprint);
+    }
+    return available;
+}
+//# sourceMappingURL=cache.js.map
\ No newline at end of file
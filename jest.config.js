@@ -0,0 +1,4 @@
+export default {
+  testEnvironment: 'node',
+  roots: ['<rootDir>/build/test']
+};
@@ -0,0 +1,87 @@
+#!/usr/bin/env node
+
+// Measures tracker startup overhead: the time from launching the CLI until the
+// tracked Python script starts running. Cold runs use an empty dependency cache,
+// warm runs reuse the cache written by the first run.
+//
+// Usage: node scripts/bench-startup.mjs [runs] [--fast-start]
+
+import { spawn } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const cliPath = path.join(path.dirname(fileURLToPath(import.meta.url)), '..', 'dist', 'cli.js');
+const args = process.argv.slice(2);
+const runs = Number(args.find((arg) => !arg.startsWith('--')) || 5);
+const cliOptions = args.filter((arg) => arg.startsWith('--'));
+const marker = 'AI_TRACKER_BENCH_CHILD_START=';
+
+const workDir = fs.mkdtempSync(path.join(os.tmpdir(), 'ai-tracker-bench-'));
+const childScript = path.join(workDir, 'child.py');
+fs.writeFileSync(childScript, `import time\nprint('${marker}' + repr(time.time()), flush=True)\n`);
+
+function runOnce(cacheDir) {
+  return new Promise((resolve, reject) => {
+    const launchedAt = Date.now();
+    const cli = spawn(process.execPath, [
+      cliPath,
+      '--project', 'bench',
+      '--team', 'bench',
+      '--environment', 'development',
+      '--dashboard-url', 'http://127.0.0.1:9',
+      ...cliOptions,
+      'python', childScript
+    ], {
+      cwd: workDir,
+      stdio: ['ignore', 'pipe', 'inherit'],
+      env: { ...process.env, AI_IMPACT_TRACKER_CACHE_DIR: cacheDir }
+    });
+
+    let output = '';
+    cli.stdout.on('data', (data) => {
+      output += data.toString();
+    });
+
+    cli.on('close', () => {
+      const line = output.split('\n').find((l) => l.startsWith(marker));
+      if (!line) {
+        reject(new Error(`Tracked script never started. Output:\n${output}`));
+        return;
+      }
+      resolve(Number(line.slice(marker.length)) * 1000 - launchedAt);
+    });
+
+    cli.on('error', reject);
+  });
+}
+
+function summarize(label, samples) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const median = sorted[Math.floor(sorted.length / 2)];
+  console.log(
+    `${label}: median ${median.toFixed(0)} ms, min ${sorted[0].toFixed(0)} ms, ` +
+    `max ${sorted[sorted.length - 1].toFixed(0)} ms (${samples.length} runs)`
+  );
+}
+
+try {
+  const cold = [];
+  for (let i = 0; i < runs; i++) {
+    cold.push(await runOnce(fs.mkdtempSync(path.join(workDir, 'cache-'))));
+  }
+
+  const warmCacheDir = fs.mkdtempSync(path.join(workDir, 'cache-'));
+  await runOnce(warmCacheDir);
+  const warm = [];
+  for (let i = 0; i < runs; i++) {
+    warm.push(await runOnce(warmCacheDir));
+  }
+
+  console.log('Launch to tracked script start:');
+  summarize('  cold dependency cache', cold);
+  summarize('  warm dependency cache', warm);
+} finally {
+  fs.rmSync(workDir, { recursive: true, force: true });
+}
@@ -2,12 +2,11 @@
 
 import { Command } from 'commander';
 import { spawn } from 'child_process';
-import { createProject } from './cli/create.js';
-import inquirer from 'inquirer';
 import fs from 'fs-extra';
 import path from 'path';
 import os from 'os';
 import dotenv from 'dotenv';
+import { checkDependenciesWithCache, getPythonFingerprint } from './cli/cache.js';
 import packageJson from '../package.json' assert { type: 'json' };
 
 
@@ -27,6 +26,7 @@ program
   .option('-y, --yes', 'Skip prompts and use defaults')
   .action(async (projectName: string, options: { template: string; yes: boolean }) => {
     try {
+      const { createProject } = await import('./cli/create.js');
       await createProject(projectName, options);
     } catch (error) {
       console.error('Error creating project:', error);
@@ -40,12 +40,15 @@ program
   .option('-t, --team <name>', 'Team name')
   .option('-e, --environment <env>', 'Environment')
   .option('--dashboard-url <url>', 'Dashboard URL', 'http://localhost:8000')
-  .action(async (script: string[], options: { project?: string; team?: string; environment?: string; dashboardUrl?: string }) => {
+  .option('--fast-start', 'Start the script before the tracking libraries finish loading (very short runs may go unmeasured)')
+  .action(async (script: string[], options: { project?: string; team?: string; environment?: string; dashboardUrl?: string; fastStart?: boolean }) => {
     try {
       const scriptCommand = script.join(' ');
       
-      // Interactive prompts for missing options
-      const answers = await inquirer.prompt([
+      // Interactive prompts for missing options (inquirer is only loaded when needed)
+      const needsPrompt = !options.project || !options.team || !options.environment;
+      const inquirer = needsPrompt ? (await import('inquirer')).default : null;
+      const answers: Record<string, string> = !inquirer ? {} : await inquirer.prompt([
         {
           type: 'input',
           name: 'project',
@@ -92,7 +95,7 @@ program
       
       // Create Python wrapper that handles tracking and sends data to dashboard
       const pythonWrapper = `
-import os, sys, subprocess, time, requests
+import os, sys, subprocess, threading, time
 from datetime import datetime
 
 # Set environment variables
@@ -103,51 +106,84 @@ os.environ['AI_DASHBOARD_RUN_ID'] = datetime.now().strftime('%Y%m%d_%H%M%S')
 
 print('Starting environmental tracking...')
 
-# Initialize both trackers
 energy_consumed = 0.0
 co2_emissions = 0.0
 water_usage = 0.0
+tracker = None
+carbon_tracker = None
+tracking_started_at = None
+fast_start = ${options.fastStart ? 'True' : 'False'}
 
-try:
-    from codecarbon import EmissionsTracker
-    from carbontracker.tracker import CarbonTracker
-    
-    # CodeCarbon
-    tracker = EmissionsTracker(
-        project_name='${project}',
-        save_to_file=True,
-        output_file=f'./data/{os.environ["AI_DASHBOARD_RUN_ID"]}_emissions.csv',
-        log_level='error'
-    )
-    
-    # CarbonTracker
-    carbon_tracker = CarbonTracker(
-        epochs=1,
-        monitor_epochs=1,
-        update_interval=1,
-        log_dir='./data',
-        verbose=2,
-        ignore_errors=True
-    )
-    
-    tracker.start()
-    carbon_tracker.epoch_start()
-    print('CodeCarbon and CarbonTracker tracking initialized')
-except ImportError as e:
-    print(f'Tracking libraries not available: {e}')
-    tracker = None
-    carbon_tracker = None
+def start_tracking():
+    global tracker, carbon_tracker, tracking_started_at
+    try:
+        from codecarbon import EmissionsTracker
+        from carbontracker.tracker import CarbonTracker
+        
+        # CodeCarbon
+        tracker = EmissionsTracker(
+            project_name='${project}',
+            save_to_file=True,
+            output_file=f'./data/{os.environ["AI_DASHBOARD_RUN_ID"]}_emissions.csv',
+            log_level='error'
+        )
+        
+        # CarbonTracker
+        carbon_tracker = CarbonTracker(
+            epochs=1,
+            monitor_epochs=1,
+            update_interval=1,
+            log_dir='./data',
+            verbose=2,
+            ignore_errors=True
+        )
+        
+        tracker.start()
+        carbon_tracker.epoch_start()
+        tracking_started_at = time.time()
+        print('CodeCarbon and CarbonTracker tracking initialized')
+    except ImportError as e:
+        print(f'Tracking libraries not available: {e}')
+        tracker = None
+        carbon_tracker = None
+    except Exception as e:
+        print(f'Could not start tracking: {e}')
+        tracker = None
+        carbon_tracker = None
+
+# Initialize both trackers before the script, unless --fast-start defers them until it is running
+if not fast_start:
+    start_tracking()
 
 # Run the script
 start_time = time.time()
 cmd = ${JSON.stringify(script)}
 print(f'Executing: {" ".join(cmd)}')
 
+child_exit = {}
+
+def wait_for_child(child):
+    child_exit['returncode'] = child.wait()
+    child_exit['time'] = time.time()
+
 try:
-    result = subprocess.run(cmd, check=False)
-    end_time = time.time()
+    child = subprocess.Popen(cmd)
+    waiter = threading.Thread(target=wait_for_child, args=(child,))
+    waiter.start()
+    
+    if fast_start:
+        start_tracking()
+    
+    waiter.join()
+    returncode = child_exit['returncode']
+    end_time = child_exit['time']
     duration = end_time - start_time
     
+    # With --fast-start a short script can finish before the trackers are running
+    missed_run = tracking_started_at is not None and tracking_started_at >= end_time
+    if missed_run:
+        print('Script finished before tracking started - this run was not measured')
+    
     # Stop tracking and get measurements
     if carbon_tracker:
         carbon_tracker.epoch_end()
@@ -178,46 +214,51 @@ try:
     print(f'Duration: {duration:.2f} seconds')
     
     # Send data to dashboard
-    try:
-        # First try to authenticate
-        username = os.environ.get('DASHBOARD_USERNAME', 'admin')
-        password = os.environ.get('DASHBOARD_PASSWORD', 'admin123')
-        login_data = {'username': username, 'password': password}
-        login_response = requests.post('${dashboardUrl}/api/auth/login', json=login_data, timeout=10)
+    if missed_run:
+        print('Not sending to dashboard: no measurement for this run')
+    else:
+        try:
+            import requests
+
+            # First try to authenticate
+            username = os.environ.get('DASHBOARD_USERNAME', 'admin')
+            password = os.environ.get('DASHBOARD_PASSWORD', 'admin123')
+            login_data = {'username': username, 'password': password}
+            login_response = requests.post('${dashboardUrl}/api/auth/login', json=login_data, timeout=10)
         
-        if login_response.status_code == 200:
-            token = login_response.json().get('access_token')
-            if token:
-                data = {
-                    'project': '${project}',
-                    'team': '${team}',
-                    'environment': '${environment}',
-                    'energy_consumed': energy_consumed,
-                    'emissions': co2_emissions,
-                    'water_usage': water_usage,
-                    'duration': duration,
-                    'timestamp': datetime.now().isoformat()
-                }
-                print(f'Sending metrics to dashboard: {data}')
-                headers = {'Authorization': f'Bearer {token}'}
-                response = requests.post('${dashboardUrl}/api/metrics', json=data, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    print('Data sent to dashboard successfully!')
+            if login_response.status_code == 200:
+                token = login_response.json().get('access_token')
+                if token:
+                    data = {
+                        'project': '${project}',
+                        'team': '${team}',
+                        'environment': '${environment}',
+                        'energy_consumed': energy_consumed,
+                        'emissions': co2_emissions,
+                        'water_usage': water_usage,
+                        'duration': duration,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    print(f'Sending metrics to dashboard: {data}')
+                    headers = {'Authorization': f'Bearer {token}'}
+                    response = requests.post('${dashboardUrl}/api/metrics', json=data, headers=headers, timeout=10)
+                    if response.status_code == 200:
+                        print('Data sent to dashboard successfully!')
+                    else:
+                        print(f'Dashboard response: {response.status_code}')
                 else:
-                    print(f'Dashboard response: {response.status_code}')
+                    print('No access token received')
             else:
-                print('No access token received')
-        else:
-            print(f'Could not authenticate: {login_response.status_code}')
-    except Exception as e:
-        print(f'Could not send to dashboard: {e}')
+                print(f'Could not authenticate: {login_response.status_code}')
+        except Exception as e:
+            print(f'Could not send to dashboard: {e}')
     
-    if result.returncode == 0:
+    if returncode == 0:
         print('AI training completed successfully')
     else:
-        print(f'AI training failed (exit code: {result.returncode})')
+        print(f'AI training failed (exit code: {returncode})')
     
-    sys.exit(result.returncode)
+    sys.exit(returncode)
     
 except Exception as e:
     if carbon_tracker:
@@ -240,7 +281,6 @@ except Exception as e:
       
       const child = spawn('python', [tempFile], {
         stdio: 'inherit',
-        shell: true,
         env: { ...process.env, PYTHONPATH: process.cwd() }
       });
       
@@ -276,83 +316,57 @@ except Exception as e:
     }
   });
 
-async function checkAndInstallDependencies(): Promise<void> {
-  return new Promise(async (resolve, reject) => {
-    // Check if required packages are installed
-    const checkCommand = `python -c "
-try:
-    import carbontracker
-    import requests
-    import codecarbon
-
-    print('All dependencies available')
-except ImportError as e:
-    print(f'Missing dependency: {e}')
-    exit(1)
-"`;
+const REQUIRED_PYTHON_PACKAGES = ['carbontracker', 'codecarbon', 'requests'];
+function probePythonDependencies(): Promise<boolean> {
+  return new Promise((resolve) => {
+    // Check if required packages are installed, without importing them
+    const checkCommand = [
+      'import importlib.util, sys',
+      `missing = [name for name in ${JSON.stringify(REQUIRED_PYTHON_PACKAGES)} if importlib.util.find_spec(name) is None]`,
+      "print(f'Missing dependencies: {missing}' if missing else 'All dependencies available')",
+      'sys.exit(1 if missing else 0)'
+    ].join('\n');
 
     const checkChild = spawn('python', ['-c', checkCommand], {
-      stdio: 'pipe',
-      shell: true
+      stdio: 'pipe'
     });
 
-    let output = '';
-    checkChild.stdout?.on('data', (data) => {
-      output += data.toString();
-    });
+    checkChild.on('close', (code) => resolve(code === 0));
+    checkChild.on('error', () => resolve(false));
+  });
+}
 
-    checkChild.on('close', async (code) => {
-      if (code === 0) {
-        console.log('Dependencies ready');
-        resolve();
-      } else {
-        // Ask for permission to install dependencies
-        const { installDeps } = await inquirer.prompt([
-          {
-            type: 'confirm',
-            name: 'installDeps',
-            message: 'Missing dependencies (carbontracker, codecarbon, requests). Install them now?',
-            default: true
-          }
-        ]);
-        
-        if (installDeps) {
-          console.log('Installing required dependencies...');
-          installDependencies().then(resolve).catch(reject);
-        } else {
-          console.log('Skipping dependency installation. The script will not be able to track the environmental impact.');
-          resolve();
-        }
-      }
-    });
+async function checkAndInstallDependencies(): Promise<void> {
+  const fingerprint = await getPythonFingerprint();
+  if (await checkDependenciesWithCache(fingerprint, probePythonDependencies)) {
+    console.log('Dependencies ready');
+    return;
+  }
 
-    checkChild.on('error', async () => {
-      // Ask for permission to install dependencies
-      const { installDeps } = await inquirer.prompt([
-        {
-          type: 'confirm',
-          name: 'installDeps',
-          message: 'Missing dependencies (carbontracker, codecarbon, requests). Install them now?',
-          default: true
-        }
-      ]);
-      
-      if (installDeps) {
-        console.log('Installing required dependencies...');
-        installDependencies().then(resolve).catch(reject);
-      } else {
-        console.log('Skipping dependency installation. Some features may not work.');
-        resolve();
-      }
-    });
-  });
+  // Ask for permission to install dependencies
+  const { default: inquirer } = await import('inquirer');
+  const { installDeps } = await inquirer.prompt([
+    {
+      type: 'confirm',
+      name: 'installDeps',
+      message: 'Missing dependencies (carbontracker, codecarbon, requests). Install them now?',
+      default: true
+    }
+  ]);
+
+  if (installDeps) {
+    console.log('Installing required dependencies...');
+    await installDependencies();
+  } else {
+    console.log('Skipping dependency installation. The script will not be able to track the environmental impact.');
+  }
 }
 
 async function installDependencies(): Promise<void> {
   return new Promise((resolve, reject) => {
     console.log('Installing carbontracker, codecarbon, and requests...');
     
-    const installChild = spawn('pip', ['install', 'carbontracker', 'codecarbon', 'requests'], {
+    const installChild = spawn('pip', ['install', ...REQUIRED_PYTHON_PACKAGES], {
       stdio: 'inherit',
       shell: true
     });
@@ -0,0 +1,169 @@
+import fs from 'fs-extra';
+import path from 'path';
+import os from 'os';
+import {
+  DEPENDENCY_CACHE_TTL_MS,
+  cacheDependencyCheck,
+  checkDependenciesWithCache,
+  getDependencyCacheFile,
+  getPythonFingerprint,
+  isDependencyCheckCached
+} from './cache.js';
+
+const originalEnv = { ...process.env };
+let tempDir: string;
+
+beforeEach(async () => {
+  tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'ai-tracker-cache-test-'));
+  process.env.AI_IMPACT_TRACKER_CACHE_DIR = path.join(tempDir, 'cache');
+  delete process.env.AI_IMPACT_TRACKER_NO_CACHE;
+});
+
+afterEach(async () => {
+  process.env = { ...originalEnv };
+  await fs.remove(tempDir);
+});
+
+describe('dependency check cache', () => {
+  it('stores the cache under AI_IMPACT_TRACKER_CACHE_DIR', async () => {
+    await cacheDependencyCheck('env-a');
+
+    expect(getDependencyCacheFile()).toBe(path.join(tempDir, 'cache', 'dependencies.json'));
+    expect(await fs.readJson(getDependencyCacheFile())).toHaveProperty('env-a');
+    expect(await isDependencyCheckCached('env-a')).toBe(true);
+    expect(await isDependencyCheckCached('env-b')).toBe(false);
+  });
+
+  it('ignores entries older than the TTL', async () => {
+    await fs.outputJson(getDependencyCacheFile(), { 'env-a': Date.now() - DEPENDENCY_CACHE_TTL_MS - 1 });
+
+    expect(await isDependencyCheckCached('env-a')).toBe(false);
+  });
+
+  it('drops expired entries when writing', async () => {
+    await fs.outputJson(getDependencyCacheFile(), {
+      expired: Date.now() - DEPENDENCY_CACHE_TTL_MS - 1,
+      fresh: Date.now()
+    });
+
+    await cacheDependencyCheck('env-a');
+
+    expect(Object.keys(await fs.readJson(getDependencyCacheFile())).sort()).toEqual(['env-a', 'fresh']);
+  });
+
+  it('is bypassed when AI_IMPACT_TRACKER_NO_CACHE is set', async () => {
+    await cacheDependencyCheck('env-a');
+    process.env.AI_IMPACT_TRACKER_NO_CACHE = '1';
+
+    expect(await isDependencyCheckCached('env-a')).toBe(false);
+  });
+
+  it('never reports a cache hit without a fingerprint', async () => {
+    expect(await isDependencyCheckCached(null)).toBe(false);
+  });
+
+  it.each(['not json', 'null', '[]', '42'])('treats a corrupt cache file (%s) as empty', async (contents) => {
+    await fs.outputFile(getDependencyCacheFile(), contents);
+
+    expect(await isDependencyCheckCached('env-a')).toBe(false);
+    await cacheDependencyCheck('env-a');
+    expect(await isDependencyCheckCached('env-a')).toBe(true);
+  });
+
+  it('leaves no temp files behind', async () => {
+    await cacheDependencyCheck('env-a');
+
+    expect(await fs.readdir(path.dirname(getDependencyCacheFile()))).toEqual(['dependencies.json']);
+  });
+});
+
+describe('checkDependenciesWithCache', () => {
+  it('caches passing checks', async () => {
+    let calls = 0;
+    const check = async () => {
+      calls++;
+      return true;
+    };
+
+    expect(await checkDependenciesWithCache('env-a', check)).toBe(true);
+    expect(await checkDependenciesWithCache('env-a', check)).toBe(true);
+    expect(calls).toBe(1);
+  });
+
+  it('does not cache failing checks', async () => {
+    let calls = 0;
+    const check = async () => {
+      calls++;
+      return false;
+    };
+
+    expect(await checkDependenciesWithCache('env-a', check)).toBe(false);
+    expect(await checkDependenciesWithCache('env-a', check)).toBe(false);
+    expect(calls).toBe(2);
+    expect(await fs.pathExists(getDependencyCacheFile())).toBe(false);
+  });
+
+  it('always runs the check without a fingerprint', async () => {
+    let calls = 0;
+    const check = async () => {
+      calls++;
+      return true;
+    };
+
+    await checkDependenciesWithCache(null, check);
+    await checkDependenciesWithCache(null, check);
+    expect(calls).toBe(2);
+  });
+});
+
+const describeUnix = process.platform === 'win32' ? describe.skip : describe;
+
+describeUnix('getPythonFingerprint', () => {
+  async function fingerprintWithPath(dir: string) {
+    process.env.PATH = dir;
+    delete process.env.VIRTUAL_ENV;
+    delete process.env.CONDA_PREFIX;
+    delete process.env.PYTHONHOME;
+    return getPythonFingerprint();
+  }
+
+  it('tells a venv apart from the interpreter it links to', async () => {
+    const baseBin = path.join(tempDir, 'base', 'bin');
+    const venvBin = path.join(tempDir, 'venv', 'bin');
+    await fs.outputFile(path.join(baseBin, 'python'), 'interpreter');
+    await fs.ensureDir(venvBin);
+    await fs.symlink(path.join(baseBin, 'python'), path.join(venvBin, 'python'));
+    await fs.outputFile(path.join(tempDir, 'venv', 'pyvenv.cfg'), 'home = base/bin\n');
+
+    const base = await fingerprintWithPath(baseBin);
+    const venv = await fingerprintWithPath(venvBin);
+
+    expect(base).not.toBeNull();
+    expect(venv).not.toBeNull();
+    expect(venv).not.toBe(base);
+  });
+
+  it('changes when the venv is recreated', async () => {
+    const venvBin = path.join(tempDir, 'venv', 'bin');
+    const venvConfig = path.join(tempDir, 'venv', 'pyvenv.cfg');
+    await fs.outputFile(path.join(venvBin, 'python'), 'interpreter');
+    await fs.outputFile(venvConfig, 'home = base/bin\n');
+    await fs.utimes(venvConfig, new Date(0), new Date(0));
+    const before = await fingerprintWithPath(venvBin);
+
+    await fs.utimes(venvConfig, new Date(), new Date());
+
+    expect(await fingerprintWithPath(venvBin)).not.toBe(before);
+  });
+
+  it('is null for version manager shims', async () => {
+    const shims = path.join(tempDir, '.pyenv', 'shims');
+    await fs.outputFile(path.join(shims, 'python'), '#!/usr/bin/env bash\n');
+
+    expect(await fingerprintWithPath(shims)).toBeNull();
+  });
+
+  it('is null when python is not on PATH', async () => {
+    expect(await fingerprintWithPath(path.join(tempDir, 'empty'))).toBeNull();
+  });
+});
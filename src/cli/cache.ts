@@ -0,0 +1,124 @@
+import fs from 'fs-extra';
+import path from 'path';
+import os from 'os';
+import { createHash } from 'crypto';
+
+export const DEPENDENCY_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+
+type DependencyCache = Record<string, number>;
+
+export function getDependencyCacheFile(): string {
+  const cacheDir = process.env.AI_IMPACT_TRACKER_CACHE_DIR
+    || path.join(process.env.XDG_CACHE_HOME || path.join(os.homedir(), '.cache'), 'ai-impact-tracker');
+  return path.join(cacheDir, 'dependencies.json');
+}
+
+async function findPythonOnPath(): Promise<string | null> {
+  const extensions = process.platform === 'win32' ? (process.env.PATHEXT || '.EXE').split(';') : [''];
+  for (const dir of (process.env.PATH || '').split(path.delimiter)) {
+    if (!dir) continue;
+    for (const extension of extensions) {
+      const candidate = path.join(dir, `python${extension}`);
+      try {
+        if ((await fs.stat(candidate)).isFile()) {
+          return candidate;
+        }
+      } catch (e) {
+        // Not in this PATH entry
+      }
+    }
+  }
+  return null;
+}
+
+// Identifies the Python environment the wrapper will run in, without starting Python.
+// Returns null when the environment can't be identified reliably, which disables caching.
+export async function getPythonFingerprint(): Promise<string | null> {
+  try {
+    const executable = await findPythonOnPath();
+
+    // Version manager shims (pyenv, asdf) choose the interpreter at run time
+    if (!executable || path.basename(path.dirname(executable)) === 'shims') return null;
+
+    const target = await fs.realpath(executable);
+    const stat = await fs.stat(target);
+    const parts: unknown[] = [
+      executable,
+      target,
+      stat.size,
+      stat.mtimeMs,
+      process.cwd(),
+      process.env.VIRTUAL_ENV,
+      process.env.CONDA_PREFIX,
+      process.env.PYTHONHOME
+    ];
+
+    // A venv's python links to the base interpreter, so pyvenv.cfg tells them apart
+    const venvConfig = path.join(path.dirname(path.dirname(executable)), 'pyvenv.cfg');
+    try {
+      parts.push(venvConfig, (await fs.stat(venvConfig)).mtimeMs);
+    } catch (e) {
+      // Not a venv
+    }
+
+    return createHash('sha256').update(JSON.stringify(parts)).digest('hex');
+  } catch (e) {
+    return null;
+  }
+}
+
+async function readDependencyCache(): Promise<DependencyCache> {
+  try {
+    const cache = await fs.readJson(getDependencyCacheFile());
+    if (cache && typeof cache === 'object' && !Array.isArray(cache)) {
+      return cache;
+    }
+  } catch (e) {
+    // Missing or corrupt cache file
+  }
+  return {};
+}
+
+export async function isDependencyCheckCached(fingerprint: string | null): Promise<boolean> {
+  if (!fingerprint || process.env.AI_IMPACT_TRACKER_NO_CACHE) return false;
+  const checkedAt = (await readDependencyCache())[fingerprint];
+  return typeof checkedAt === 'number' && Date.now() - checkedAt < DEPENDENCY_CACHE_TTL_MS;
+}
+
+export async function cacheDependencyCheck(fingerprint: string): Promise<void> {
+  const now = Date.now();
+  const cache: DependencyCache = {};
+  for (const [key, checkedAt] of Object.entries(await readDependencyCache())) {
+    if (typeof checkedAt === 'number' && now - checkedAt < DEPENDENCY_CACHE_TTL_MS) {
+      cache[key] = checkedAt;
+    }
+  }
+  cache[fingerprint] = now;
+
+  // Write to a temp file and rename it so parallel runs never read a half-written cache
+  const cacheFile = getDependencyCacheFile();
+  const tempFile = `${cacheFile}.${process.pid}.tmp`;
+  try {
+    await fs.outputJson(tempFile, cache);
+    await fs.rename(tempFile, cacheFile);
+  } catch (e) {
+    // Caching is best effort
+    await fs.remove(tempFile).catch(() => undefined);
+  }
+}
+
+// Runs the check unless it already passed recently for this environment. Only passing checks are cached.
+export async function checkDependenciesWithCache(
+  fingerprint: string | null,
+  check: () => Promise<boolean>
+): Promise<boolean> {
+  if (await isDependencyCheckCached(fingerprint)) {
+    return true;
+  }
+
+  const available = await check();
+  if (available && fingerprint) {
+    await cacheDependencyCheck(fingerprint);
+  }
+  return available;
+}